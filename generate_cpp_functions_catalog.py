@@ -3,20 +3,46 @@ Comprehensive C++ DSA Functions Catalog Generator
 Generates a multi-sheet Excel workbook with detailed information about C++ Standard Library
 functions, algorithms, and container methods commonly used in DSA.
 
-Run: python generate_cpp_functions_catalog.py
-Requires: pip install pandas openpyxl
+Run: python generate_cpp_functions_catalog.py [--csv] [--force]
+     (--csv also writes each sheet to cpp_dsa_functions_catalog_csv/;
+      --force rebuilds the workbook even when it looks up to date;
+      FAST=1 in the environment saves the workbook uncompressed)
+Requires: pip install openpyxl lxml
 """
 
-import pandas as pd
+from array import array
+from bisect import bisect_right
+import csv
+import functools
+import hashlib
+import heapq
+import os
+from itertools import groupby
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import re
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+from zipfile import BadZipFile, ZipFile, ZIP_STORED
+from string import ascii_uppercase
+
+# ==============================================================================
+# SHEET COLUMNS
+# ==============================================================================
+# Column order shared by every entry of a sheet; entries are converted into
+# records (see CATALOG RECORDS) in this order.
+ALGORITHM_HEADERS = (
+    "Category", "Function", "Header", "Signature", "Time Complexity",
+    "Space Complexity", "Description", "Arguments", "Return Type", "When to Use",
+    "When NOT to Use", "Example", "Real World Frequency", "DSA Training Frequency",
+    "C++ Version", "Notes",
+)
+CONTAINER_HEADERS = tuple(h for h in ALGORITHM_HEADERS if h != "Header")
 
 # ==============================================================================
 # EXAMPLE SHEET: ALGORITHM LIBRARY FUNCTIONS
 # ==============================================================================
-algorithm_functions = [
+algorithm_functions = (
     # ==================== SORTING ALGORITHMS ====================
     {
         "Category": "Sorting",
@@ -994,13 +1020,13 @@ algorithm_functions = [
         "C++ Version": "C++98",
         "Notes": "Returns function object (can accumulate state); range-for often clearer in modern C++"
     },
-]
+)
 
 
 # ==============================================================================
 # VECTOR CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-vector_functions = [
+vector_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -1605,13 +1631,13 @@ vector_functions = [
         "C++ Version": "C++98",
         "Notes": "Constant time; swaps internal pointers; doesn't invalidate iterators to other container"
     },
-]
+)
 
 
 # ==============================================================================
 # MAP CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-map_functions = [
+map_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -2254,13 +2280,13 @@ map_functions = [
         "C++ Version": "C++98",
         "Notes": "Compares pairs using key comparison; very rarely used"
     },
-]
+)
 
 
 # ==============================================================================
 # SET CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-set_functions = [
+set_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -2850,13 +2876,13 @@ set_functions = [
         "C++ Version": "C++98",
         "Notes": "Identical to key_comp for set; exists for API consistency"
     },
-]
+)
 
 
 # ==============================================================================
 # UNORDERED_SET CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-unordered_set_functions = [
+unordered_set_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -3276,13 +3302,13 @@ unordered_set_functions = [
         "C++ Version": "C++11",
         "Notes": "Performance optimization; very useful"
     },
-]
+)
 
 
 # ==============================================================================
 # MULTISET CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-multiset_functions = [
+multiset_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -3632,13 +3658,13 @@ multiset_functions = [
         "C++ Version": "C++98",
         "Notes": "Very useful for multiset; returns all duplicates"
     },
-]
+)
 
 
 # ==============================================================================
 # MULTIMAP CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-multimap_functions = [
+multimap_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -4007,13 +4033,13 @@ multimap_functions = [
         "C++ Version": "C++98",
         "Notes": "Essential for multimap; gets all values for a key"
     },
-]
+)
 
 
 # ==============================================================================
 # DEQUE CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-deque_functions = [
+deque_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -4448,13 +4474,13 @@ deque_functions = [
         "C++ Version": "C++98",
         "Notes": "Constant time; swaps pointers"
     },
-]
+)
 
 
 # ==============================================================================
 # LIST CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-list_functions = [
+list_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -4976,13 +5002,13 @@ list_functions = [
         "C++ Version": "C++98",
         "Notes": "O(n log n); stable; member function (can't use std::sort on list)"
     },
-]
+)
 
 
 # ==============================================================================
 # FORWARD_LIST CONTAINER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-forward_list_functions = [
+forward_list_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -5470,13 +5496,13 @@ forward_list_functions = [
         "C++ Version": "C++11",
         "Notes": "O(n log n); stable; member function"
     },
-]
+)
 
 
 # ==============================================================================
 # STRING CONTAINER - COMMONLY USED MEMBER FUNCTIONS
 # ==============================================================================
-string_functions = [
+string_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -6047,13 +6073,13 @@ string_functions = [
         "C++ Version": "C++20",
         "Notes": "Modern; cleaner than substr comparison"
     },
-]
+)
 
 
 # ==============================================================================
 # STACK CONTAINER ADAPTER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-stack_functions = [
+stack_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -6231,13 +6257,13 @@ stack_functions = [
         "C++ Version": "C++98",
         "Notes": "Constant time; swaps underlying containers"
     },
-]
+)
 
 
 # ==============================================================================
 # QUEUE CONTAINER ADAPTER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-queue_functions = [
+queue_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -6432,13 +6458,13 @@ queue_functions = [
         "C++ Version": "C++98",
         "Notes": "Constant time; swaps underlying containers"
     },
-]
+)
 
 
 # ==============================================================================
 # PRIORITY_QUEUE CONTAINER ADAPTER - ALL MEMBER FUNCTIONS
 # ==============================================================================
-priority_queue_functions = [
+priority_queue_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -6633,13 +6659,13 @@ priority_queue_functions = [
         "C++ Version": "C++98",
         "Notes": "Constant time; swaps underlying containers"
     },
-]
+)
 
 
 # ==============================================================================
 # UNORDERED_MAP CONTAINER - COMMONLY USED MEMBER FUNCTIONS
 # ==============================================================================
-unordered_map_functions = [
+unordered_map_functions = (
     # ==================== CONSTRUCTORS ====================
     {
         "Category": "Construction",
@@ -7129,198 +7155,658 @@ unordered_map_functions = [
         "C++ Version": "C++11",
         "Notes": "Very useful; equivalent to rehash(ceil(count/max_load_factor))"
     },
-]
+)
+
+
+# ==============================================================================
+# CATALOG RECORDS
+# ==============================================================================
+class AlgorithmEntry(NamedTuple):
+    """One Algorithm Library row; fields follow ALGORITHM_HEADERS"""
+    category: str
+    function: str
+    header: str
+    signature: str
+    time_complexity: str
+    space_complexity: str
+    description: str
+    arguments: str
+    return_type: str
+    when_to_use: str
+    when_not_to_use: str
+    example: str
+    real_world_frequency: int
+    dsa_training_frequency: int
+    cpp_version: str
+    notes: str
+
+
+class ContainerMethod(NamedTuple):
+    """One container member function row; fields follow CONTAINER_HEADERS"""
+    category: str
+    function: str
+    signature: str
+    time_complexity: str
+    space_complexity: str
+    description: str
+    arguments: str
+    return_type: str
+    when_to_use: str
+    when_not_to_use: str
+    example: str
+    real_world_frequency: int
+    dsa_training_frequency: int
+    cpp_version: str
+    notes: str
+
+
+def to_records(entries, headers, record_type):
+    """Freeze catalog dicts into immutable records, in header order"""
+    return tuple(record_type._make([entry[h] for h in headers]) for entry in entries)
+
+
+def container_records(entries):
+    """Records for a container member-function sheet"""
+    return to_records(entries, CONTAINER_HEADERS, ContainerMethod)
+
+
+ALGORITHMS = to_records(algorithm_functions, ALGORITHM_HEADERS, AlgorithmEntry)
+
+
+# ==============================================================================
+# ALGORITHM QUERIES
+# ==============================================================================
+# The query tables below are derived from ALGORITHMS on first use and cached,
+# so generating the workbook (which never queries) does not build them.
+# Query results are tuples and the most recent ones are memoized as well.
+
+def dictionary_encode(values):
+    """Split a low-cardinality column into its distinct values and one-byte codes"""
+    vocabulary = tuple(dict.fromkeys(values))
+    codes = {value: i for i, value in enumerate(vocabulary)}
+    return vocabulary, array('B', [codes[value] for value in values])
+
+
+def slices_by(values):
+    """Map each distinct value of a column to the slice of rows holding it
+
+    Rows sharing a value must be contiguous, as the catalog is authored
+    grouped by category.
+    """
+    slices = {}
+    start = 0
+    for value, group in groupby(values):
+        if value in slices:
+            raise ValueError(f"Rows for {value!r} are not contiguous")
+        stop = start + sum(1 for _ in group)
+        slices[value] = slice(start, stop)
+        start = stop
+    return slices
+
+
+# Leading O(...) term of a complexity -> growth class (lower grows slower).
+# Qualifiers after the leading term ("average", "worst, ...") are ignored;
+# notations with an unlisted leading term are left unranked.
+COMPLEXITY_RANKS = {
+    "O(1)": 0,
+    "O(log n)": 1,
+    "O(log min(m,n))": 1,
+    "O(n)": 2,
+    "O(n + m)": 2,
+    "O(n log k)": 3,
+    "O(n log n)": 3,
+    "O(n log² n)": 4,
+    "O(n*m)": 5,
+    "O(n^2)": 6,
+}
+_RANKED_TERMS = sorted(COMPLEXITY_RANKS, key=len, reverse=True)
+UNRANKED = 255
+
+
+def complexity_rank(notation):
+    """Growth class of a complexity string from its leading O(...) term, or UNRANKED"""
+    for term in _RANKED_TERMS:
+        if notation.startswith(term):
+            return COMPLEXITY_RANKS[term]
+    return UNRANKED
+
+
+# Short fields that filters and rankings scan. The long prose fields
+# (description, arguments, when to use, example, notes, ...) stay on the
+# records and are only read when an entry itself is inspected.
+HOT_FIELDS = (
+    "category", "function", "header", "time_complexity", "space_complexity",
+    "return_type", "real_world_frequency", "dsa_training_frequency", "cpp_version",
+)
+
+
+@functools.cache
+def algorithm_columns():
+    """Column-oriented view of the hot ALGORITHMS fields: one tuple per field"""
+    return {field: tuple(getattr(entry, field) for entry in ALGORITHMS) for field in HOT_FIELDS}
+
+
+@functools.cache
+def encoded_columns():
+    """Low-cardinality columns as (vocabulary, codes) pairs"""
+    # Each distinct string is stored once; equality filters compare small ints
+    columns = algorithm_columns()
+    return {
+        field: dictionary_encode(columns[field])
+        for field in ("category", "header", "cpp_version", "return_type")
+    }
+
+
+@functools.cache
+def name_rows():
+    """Function name -> row index"""
+    return {name: i for i, name in enumerate(algorithm_columns()["function"])}
+
+
+@functools.cache
+def function_index():
+    """Read-only mapping of function name -> entry"""
+    return MappingProxyType(dict(zip(algorithm_columns()["function"], ALGORITHMS)))
+
+
+@functools.cache
+def category_slices():
+    """Category -> slice of ALGORITHMS"""
+    return slices_by(algorithm_columns()["category"])
+
+
+@functools.cache
+def category_index():
+    """Read-only mapping of category -> entries, in catalog order"""
+    return MappingProxyType(
+        {category: ALGORITHMS[rows] for category, rows in category_slices().items()}
+    )
+
+
+@functools.cache
+def complexity_ranks():
+    """Time and Space Complexity columns parsed once into growth classes"""
+    columns = algorithm_columns()
+    return {
+        field: array('B', map(complexity_rank, columns[field]))
+        for field in ("time_complexity", "space_complexity")
+    }
+
+
+@functools.cache
+def frequency_columns():
+    """0-10 frequency scores packed one byte per row"""
+    columns = algorithm_columns()
+    return {
+        field: array('B', columns[field])
+        for field in ("real_world_frequency", "dsa_training_frequency")
+    }
+
+
+@functools.cache
+def search_text():
+    """Function names and descriptions, lowercased and joined into one string
+
+    Returns the text and the offset at which each row starts in it.
+    """
+    rows = [f"{entry.function} {entry.description}".lower() for entry in ALGORITHMS]
+    starts = []
+    offset = 0
+    for row in rows:
+        starts.append(offset)
+        offset += len(row) + 1
+    return "\n".join(rows), starts
+
+
+@functools.cache
+def token_index():
+    """Read-only mapping of word -> rows using it in Description, When to Use or Notes"""
+    index = {}
+    for i, entry in enumerate(ALGORITHMS):
+        text = f"{entry.description} {entry.when_to_use} {entry.notes}".lower()
+        for token in set(re.findall(r"[a-z_]+", text)):
+            index.setdefault(token, []).append(i)
+    return MappingProxyType({token: frozenset(rows) for token, rows in index.items()})
+
+
+# A function mentioned in another entry's prose: written as std::name, or a
+# bare identifier with an underscore (lower_bound) so plain English words such
+# as "find" or "copy" are not mistaken for references.
+MENTION = re.compile(r"std::[a-z_]+|[a-z]+_[a-z_]+")
+
+
+@functools.cache
+def related_index():
+    """Functions each entry mentions, as CSR (offsets, neighbours) row arrays
+
+    The rows related to row i are neighbours[offsets[i]:offsets[i + 1]]. Both
+    are handed out as read-only views, since the cached arrays are shared.
+    """
+    rows = name_rows()
+    offsets = array('H', [0])
+    neighbours = array('H')
+    for i, entry in enumerate(ALGORITHMS):
+        text = " ".join((entry.description, entry.when_to_use, entry.when_not_to_use, entry.notes))
+        for mention in dict.fromkeys(MENTION.findall(text)):
+            row = rows.get(mention if mention.startswith("std::") else f"std::{mention}")
+            if row is not None and row != i:
+                neighbours.append(row)
+        offsets.append(len(neighbours))
+    return memoryview(offsets).toreadonly(), memoryview(neighbours).toreadonly()
+
+
+def get(name):
+    """Algorithm Library entry for a function name, e.g. get("std::sort")"""
+    return function_index()[name]
+
+
+@functools.lru_cache(maxsize=64)
+def where(field, value):
+    """Entries whose dictionary-encoded field equals value, in catalog order"""
+    vocabulary, codes = encoded_columns()[field]
+    if value not in vocabulary:
+        return ()
+    code = vocabulary.index(value)
+    return tuple(ALGORITHMS[i] for i, c in enumerate(codes) if c == code)
 
 
-def create_excel_catalog():
-    """Creates the Excel workbook with formatted sheets"""
+def by_category(category):
+    """Algorithm Library entries in a category, in catalog order"""
+    return category_index().get(category, ())
+
+
+@functools.lru_cache(maxsize=64)
+def no_worse_than(notation, field="time_complexity"):
+    """Entries whose complexity grows no faster than the given notation
+
+    field is "time_complexity" or "space_complexity". Entries whose complexity
+    cannot be ranked are excluded.
+    """
+    limit = complexity_rank(notation)
+    if limit == UNRANKED:
+        raise ValueError(f"Unrecognised complexity: {notation!r}")
+    ranks = complexity_ranks()[field]
+    return tuple(ALGORITHMS[i] for i, rank in enumerate(ranks) if rank <= limit)
+
+
+@functools.lru_cache(maxsize=64)
+def by_time_complexity(notation):
+    """Entries whose time complexity is in the same growth class as notation"""
+    target = complexity_rank(notation)
+    if target == UNRANKED:
+        raise ValueError(f"Unrecognised complexity: {notation!r}")
+    ranks = complexity_ranks()["time_complexity"]
+    return tuple(ALGORITHMS[i] for i, rank in enumerate(ranks) if rank == target)
+
+
+@functools.lru_cache(maxsize=64)
+def search(keyword):
+    """Entries whose function name or description contains keyword (any case)"""
+    text, starts = search_text()
+    keyword = keyword.lower()
+    found = []
+    pos = text.find(keyword)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        found.append(ALGORITHMS[row])
+        if row + 1 == len(starts):
+            break
+        # One hit per row: resume at the start of the next row
+        pos = text.find(keyword, starts[row + 1])
+    return tuple(found)
+
+
+@functools.lru_cache(maxsize=64)
+def with_words(*words):
+    """Entries whose prose fields contain every given word, in catalog order"""
+    index = token_index()
+    rows = frozenset(range(len(ALGORITHMS)))
+    for word in words:
+        rows = rows & index.get(word.lower(), frozenset())
+    return tuple(ALGORITHMS[i] for i in sorted(rows))
+
+
+def related(name):
+    """Entries that the named entry's prose refers to, in order of mention"""
+    offsets, neighbours = related_index()
+    row = name_rows()[name]
+    return tuple(ALGORITHMS[i] for i in neighbours[offsets[row]:offsets[row + 1]])
+
+
+@functools.lru_cache(maxsize=64)
+def top_by_frequency(k, by="real_world_frequency"):
+    """The k entries with the highest frequency score, ties in catalog order
+
+    by is "real_world_frequency" or "dsa_training_frequency".
+    """
+    frequencies = frequency_columns()[by]
+    # Keeps a k-sized heap instead of sorting every row
+    ranked = heapq.nlargest(k, range(len(frequencies)), key=frequencies.__getitem__)
+    return tuple(ALGORITHMS[i] for i in ranked)
+
+
+# Query tables readable as module attributes, e.g. catalog.BY_CATEGORY["Heap"];
+# each is built on first access by its cached builder.
+LAZY_TABLES = {
+    "BY_FUNCTION": function_index,
+    "BY_CATEGORY": category_index,
+    "WORD_INDEX": token_index,
+    "RELATED": related_index,
+}
+
+
+def __getattr__(name):
+    try:
+        return LAZY_TABLES[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# ==============================================================================
+# WORKBOOK STYLES
+# ==============================================================================
+# Plain values only: openpyxl is imported by the workbook writer itself, so
+# importing this module to query the catalog does not load it.
+# Colors are full ARGB (FF = opaque); 6-digit RGB would be stored with alpha 00.
+HEADER_COLOR = "FF2C3E50"
+HEADER_FONT_COLOR = "FFFFFFFF"
+BORDER_COLOR = "FFCCCCCC"
+
+CATEGORY_COLORS = {
+    # Algorithm Library categories
+    "Sorting": "FFE8F8F5",
+    "Searching": "FFFEF9E7",
+    "Min/Max": "FFFDF2E9",
+    "Permutation": "FFF4ECF7",
+    "Heap": "FFE8F6F3",
+    "Set Operations": "FFEBF5FB",
+    "Numeric": "FFFADBD8",
+    "Partitioning": "FFF9E79F",
+    "Comparison": "FFD5F4E6",
+    "Copy/Move": "FFFAE5D3",
+    "Fill/Generate": "FFEBDEF0",
+    "Transform": "FFD6EAF8",
+    # Vector categories
+    "Construction": "FFE8F8F5",
+    "Element Access": "FFFEF9E7",
+    "Iterators": "FFFDF2E9",
+    "Capacity": "FFF4ECF7",
+    "Modifiers": "FFE8F6F3",
+    # Map/Set categories
+    "Lookup": "FFFCF3CF",
+    "Observers": "FFD5F4E6",
+    # Unordered containers categories
+    "Bucket Interface": "FFE8DAEF",
+    "Hash Policy": "FFD6EAF8",
+}
+
+# Column letters A..IV, precomputed so layout code indexes a tuple instead of
+# calling get_column_letter per column
+COL_LETTERS = (*ascii_uppercase, *(a + b for a in ascii_uppercase for b in ascii_uppercase))[:256]
+
+# Column widths - known up front, so they are set before any row is streamed
+ALGORITHM_COLUMN_WIDTHS = {
+    'A': 15,  # Category
+    'B': 22,  # Function
+    'C': 12,  # Header
+    'D': 50,  # Signature
+    'E': 18,  # Time Complexity
+    'F': 18,  # Space Complexity
+    'G': 60,  # Description
+    'H': 70,  # Arguments
+    'I': 15,  # Return Type
+    'J': 60,  # When to Use
+    'K': 60,  # When NOT to Use
+    'L': 65,  # Example
+    'M': 12,  # Real World Frequency
+    'N': 12,  # DSA Training Frequency
+    'O': 12,  # C++ Version
+    'P': 50,  # Notes
+}
+CONTAINER_COLUMN_WIDTHS = {
+    'A': 15,  # Category
+    'B': 30,  # Function
+    'C': 55,  # Signature
+    'D': 18,  # Time Complexity
+    'E': 18,  # Space Complexity
+    'F': 60,  # Description
+    'G': 70,  # Arguments
+    'H': 20,  # Return Type
+    'I': 60,  # When to Use
+    'J': 60,  # When NOT to Use
+    'K': 65,  # Example
+    'L': 12,  # Real World Frequency
+    'M': 12,  # DSA Training Frequency
+    'N': 12,  # C++ Version
+    'O': 50,  # Notes
+}
+COLUMN_WIDTHS = {
+    ALGORITHM_HEADERS: ALGORITHM_COLUMN_WIDTHS,  # Algorithm Library sheet
+    CONTAINER_HEADERS: CONTAINER_COLUMN_WIDTHS,  # Vector or other container sheets
+}
+
+# Named styles - each cell gets a single style reference instead of four
+# separate font/fill/border/alignment assignments
+HEADER_STYLE = "catalog_header"
+BODY_STYLE = "catalog_body"
+CATEGORY_STYLES = {category: f"catalog_{category}" for category in CATEGORY_COLORS}
+
+TABLE_STYLE_NAME = "TableStyleMedium2"
+
+HEADER_ROW_HEIGHT = 40
+BODY_ROW_HEIGHT = 60
+
+
+# Output locations, relative to the working directory the script is run from
+OUTPUT_FILE = Path("cpp_dsa_functions_catalog.xlsx")
+CSV_OUTPUT_DIR = Path("cpp_dsa_functions_catalog_csv")
+
+
+def catalog_sheets():
+    """(title, headers, records) for every sheet, in workbook order"""
+    return (
+        ('Algorithm Library', ALGORITHM_HEADERS, ALGORITHMS),
+        ('Vector', CONTAINER_HEADERS, container_records(vector_functions)),
+        ('Map', CONTAINER_HEADERS, container_records(map_functions)),
+        ('Set', CONTAINER_HEADERS, container_records(set_functions)),
+        ('Unordered Set', CONTAINER_HEADERS, container_records(unordered_set_functions)),
+        ('Multiset', CONTAINER_HEADERS, container_records(multiset_functions)),
+        ('Multimap', CONTAINER_HEADERS, container_records(multimap_functions)),
+        ('Deque', CONTAINER_HEADERS, container_records(deque_functions)),
+        ('List', CONTAINER_HEADERS, container_records(list_functions)),
+        ('Forward List', CONTAINER_HEADERS, container_records(forward_list_functions)),
+        ('String', CONTAINER_HEADERS, container_records(string_functions)),
+        ('Stack', CONTAINER_HEADERS, container_records(stack_functions)),
+        ('Queue', CONTAINER_HEADERS, container_records(queue_functions)),
+        ('Priority Queue', CONTAINER_HEADERS, container_records(priority_queue_functions)),
+        ('Unordered Map', CONTAINER_HEADERS, container_records(unordered_map_functions)),
+    )
+
+
+# Custom document property recording which version of this script produced
+# the workbook, so an unchanged catalog is not rebuilt
+SOURCE_HASH_PROPERTY = "CatalogSourceHash"
+
+
+def source_hash():
+    """Digest of this script, which fully determines the workbook contents"""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def stored_source_hash(path):
+    """Source hash recorded in a previously generated workbook, or None"""
+    from openpyxl.packaging.custom import CustomPropertyList
+    from openpyxl.xml.constants import ARC_CUSTOM
+    from openpyxl.xml.functions import fromstring
     
-    output_file = Path("cpp_dsa_functions_catalog.xlsx")
+    try:
+        with ZipFile(path) as archive:
+            tree = fromstring(archive.read(ARC_CUSTOM))
+    except (FileNotFoundError, KeyError, BadZipFile):
+        return None
+    for prop in CustomPropertyList.from_tree(tree):
+        if prop.name == SOURCE_HASH_PROPERTY:
+            return prop.value
+    return None
+
+
+def create_excel_catalog(force=False):
+    """Creates the Excel workbook with formatted sheets
+
+    Returns False when the existing workbook is already up to date, True otherwise.
+    force=True rebuilds it regardless.
+    """
+    import lxml  # noqa: F401 - openpyxl serializes through lxml when it is importable
+    from openpyxl import Workbook
+    from openpyxl.packaging.custom import StringProperty
     
-    # Create DataFrames
-    df_algorithms = pd.DataFrame(algorithm_functions)
-    df_vector = pd.DataFrame(vector_functions)
-    df_map = pd.DataFrame(map_functions)
-    df_set = pd.DataFrame(set_functions)
-    df_unordered_set = pd.DataFrame(unordered_set_functions)
-    df_multiset = pd.DataFrame(multiset_functions)
-    df_multimap = pd.DataFrame(multimap_functions)
-    df_deque = pd.DataFrame(deque_functions)
-    df_list = pd.DataFrame(list_functions)
-    df_forward_list = pd.DataFrame(forward_list_functions)
-    df_string = pd.DataFrame(string_functions)
-    df_stack = pd.DataFrame(stack_functions)
-    df_queue = pd.DataFrame(queue_functions)
-    df_priority_queue = pd.DataFrame(priority_queue_functions)
-    df_unordered_map = pd.DataFrame(unordered_map_functions)
+    output_file = OUTPUT_FILE
+    # FAST=1 skips zip compression for quicker local iterations
+    fast = os.environ.get("FAST", "").strip() == "1"
     
-    # Write to Excel
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        df_algorithms.to_excel(writer, sheet_name='Algorithm Library', index=False)
-        df_vector.to_excel(writer, sheet_name='Vector', index=False)
-        df_map.to_excel(writer, sheet_name='Map', index=False)
-        df_set.to_excel(writer, sheet_name='Set', index=False)
-        df_unordered_set.to_excel(writer, sheet_name='Unordered Set', index=False)
-        df_multiset.to_excel(writer, sheet_name='Multiset', index=False)
-        df_multimap.to_excel(writer, sheet_name='Multimap', index=False)
-        df_deque.to_excel(writer, sheet_name='Deque', index=False)
-        df_list.to_excel(writer, sheet_name='List', index=False)
-        df_forward_list.to_excel(writer, sheet_name='Forward List', index=False)
-        df_string.to_excel(writer, sheet_name='String', index=False)
-        df_stack.to_excel(writer, sheet_name='Stack', index=False)
-        df_queue.to_excel(writer, sheet_name='Queue', index=False)
-        df_priority_queue.to_excel(writer, sheet_name='Priority Queue', index=False)
-        df_unordered_map.to_excel(writer, sheet_name='Unordered Map', index=False)
+    # Skip the rebuild when the workbook was generated from this exact source
+    # (an uncompressed build never counts as up to date for a normal one)
+    digest = source_hash() + ("-stored" if fast else "")
+    if not force and stored_source_hash(output_file) == digest:
+        print(f"✓ Up to date: {output_file}")
+        return False
     
-    # Load workbook for formatting
-    wb = load_workbook(output_file)
-    format_sheet(wb['Algorithm Library'])
-    format_sheet(wb['Vector'])
-    format_sheet(wb['Map'])
-    format_sheet(wb['Set'])
-    format_sheet(wb['Unordered Set'])
-    format_sheet(wb['Multiset'])
-    format_sheet(wb['Multimap'])
-    format_sheet(wb['Deque'])
-    format_sheet(wb['List'])
-    format_sheet(wb['Forward List'])
-    format_sheet(wb['String'])
-    format_sheet(wb['Stack'])
-    format_sheet(wb['Queue'])
-    format_sheet(wb['Priority Queue'])
-    format_sheet(wb['Unordered Map'])
+    # Stream every sheet into a write-only workbook, formatted as it is written
+    wb = Workbook(write_only=True)
+    wb.custom_doc_props.append(StringProperty(name=SOURCE_HASH_PROPERTY, value=digest))
+    register_styles(wb)
+    sheets = catalog_sheets()
+    for title, headers, records in sheets:
+        write_sheet(wb, title, headers, records)
     
-    # Save formatted workbook
-    wb.save(output_file)
-    print(f"✓ Created: {output_file}")
-    print(f"  - Algorithm Library: {len(algorithm_functions)} functions")
-    print(f"  - Vector: {len(vector_functions)} member functions")
-    print(f"  - Map: {len(map_functions)} member functions")
-    print(f"  - Set: {len(set_functions)} member functions")
-    print(f"  - Unordered Set: {len(unordered_set_functions)} member functions")
-    print(f"  - Multiset: {len(multiset_functions)} member functions")
-    print(f"  - Multimap: {len(multimap_functions)} member functions")
-    print(f"  - Deque: {len(deque_functions)} member functions")
-    print(f"  - List: {len(list_functions)} member functions")
-    print(f"  - Forward List: {len(forward_list_functions)} member functions")
-    print(f"  - String: {len(string_functions)} member functions")
-    print(f"  - Stack: {len(stack_functions)} member functions")
-    print(f"  - Queue: {len(queue_functions)} member functions")
-    print(f"  - Priority Queue: {len(priority_queue_functions)} member functions")
-    print(f"  - Unordered Map: {len(unordered_map_functions)} member functions")
-
-
-def format_sheet(ws):
-    """Apply professional formatting to worksheet"""
+    # Single save - no reload/re-format pass
+    if fast:
+        save_uncompressed(wb, output_file)
+    else:
+        wb.save(output_file)
     
-    # Define colors
-    header_fill = PatternFill(start_color="2C3E50", end_color="2C3E50", fill_type="solid")
-    category_fills = {
-        # Algorithm Library categories
-        "Sorting": PatternFill(start_color="E8F8F5", end_color="E8F8F5", fill_type="solid"),
-        "Searching": PatternFill(start_color="FEF9E7", end_color="FEF9E7", fill_type="solid"),
-        "Min/Max": PatternFill(start_color="FDF2E9", end_color="FDF2E9", fill_type="solid"),
-        "Permutation": PatternFill(start_color="F4ECF7", end_color="F4ECF7", fill_type="solid"),
-        "Heap": PatternFill(start_color="E8F6F3", end_color="E8F6F3", fill_type="solid"),
-        "Set Operations": PatternFill(start_color="EBF5FB", end_color="EBF5FB", fill_type="solid"),
-        "Numeric": PatternFill(start_color="FADBD8", end_color="FADBD8", fill_type="solid"),
-        "Partitioning": PatternFill(start_color="F9E79F", end_color="F9E79F", fill_type="solid"),
-        "Comparison": PatternFill(start_color="D5F4E6", end_color="D5F4E6", fill_type="solid"),
-        "Copy/Move": PatternFill(start_color="FAE5D3", end_color="FAE5D3", fill_type="solid"),
-        "Fill/Generate": PatternFill(start_color="EBDEF0", end_color="EBDEF0", fill_type="solid"),
-        "Transform": PatternFill(start_color="D6EAF8", end_color="D6EAF8", fill_type="solid"),
-        # Vector categories
-        "Construction": PatternFill(start_color="E8F8F5", end_color="E8F8F5", fill_type="solid"),
-        "Element Access": PatternFill(start_color="FEF9E7", end_color="FEF9E7", fill_type="solid"),
-        "Iterators": PatternFill(start_color="FDF2E9", end_color="FDF2E9", fill_type="solid"),
-        "Capacity": PatternFill(start_color="F4ECF7", end_color="F4ECF7", fill_type="solid"),
-        "Modifiers": PatternFill(start_color="E8F6F3", end_color="E8F6F3", fill_type="solid"),
-        # Map/Set categories
-        "Lookup": PatternFill(start_color="FCF3CF", end_color="FCF3CF", fill_type="solid"),
-        "Observers": PatternFill(start_color="D5F4E6", end_color="D5F4E6", fill_type="solid"),
-        # Unordered containers categories
-        "Bucket Interface": PatternFill(start_color="E8DAEF", end_color="E8DAEF", fill_type="solid"),
-        "Hash Policy": PatternFill(start_color="D6EAF8", end_color="D6EAF8", fill_type="solid"),
-    }
+    # Summary written in one call rather than one print per sheet
+    report = [f"✓ Created: {output_file}"]
+    for title, headers, records in sheets:
+        kind = "functions" if headers is ALGORITHM_HEADERS else "member functions"
+        report.append(f"  - {title}: {len(records)} {kind}")
+    sys.stdout.write("\n".join(report) + "\n")
+    return True
+
+
+def save_uncompressed(wb, output_file):
+    """Save like Workbook.save, but with the archive members stored uncompressed"""
+    from openpyxl.writer.excel import ExcelWriter
     
-    # Header row formatting
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    ExcelWriter(wb, ZipFile(output_file, 'w', ZIP_STORED, allowZip64=True)).save()
+
+
+def create_csv_catalog():
+    """Writes each sheet as a UTF-8 CSV file, for tools that cannot read .xlsx"""
     
-    # Border style
-    thin_border = Border(
-        left=Side(style='thin', color='CCCCCC'),
-        right=Side(style='thin', color='CCCCCC'),
-        top=Side(style='thin', color='CCCCCC'),
-        bottom=Side(style='thin', color='CCCCCC')
-    )
+    output_dir = CSV_OUTPUT_DIR
+    output_dir.mkdir(exist_ok=True)
     
-    # Format data rows
-    for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row), start=2):
-        category = ws[f'A{row_idx}'].value
-        row_fill = category_fills.get(category, PatternFill())
-        
-        for cell in row:
-            cell.border = thin_border
-            cell.fill = row_fill
-            cell.alignment = Alignment(vertical="top", wrap_text=True)
+    sheets = catalog_sheets()
+    for title, headers, records in sheets:
+        csv_file = output_dir / f"{title.lower().replace(' ', '_')}.csv"
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(records)
+    print(f"✓ Created: {output_dir}/ ({len(sheets)} CSV files)")
+
+
+def register_styles(wb):
+    """Register the header and per-category body styles once per workbook"""
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
     
-    # Column widths - adapt based on sheet content
-    if ws.max_column >= 16:  # Algorithm Library sheet
-        column_widths = {
-            'A': 15,  # Category
-            'B': 22,  # Function
-            'C': 12,  # Header
-            'D': 50,  # Signature
-            'E': 18,  # Time Complexity
-            'F': 18,  # Space Complexity
-            'G': 60,  # Description
-            'H': 70,  # Arguments
-            'I': 15,  # Return Type
-            'J': 60,  # When to Use
-            'K': 60,  # When NOT to Use
-            'L': 65,  # Example
-            'M': 12,  # Real World Frequency
-            'N': 12,  # DSA Training Frequency
-            'O': 12,  # C++ Version
-            'P': 50,  # Notes
-        }
-    else:  # Vector or other container sheets
-        column_widths = {
-            'A': 15,  # Category
-            'B': 30,  # Function
-            'C': 55,  # Signature
-            'D': 18,  # Time Complexity
-            'E': 18,  # Space Complexity
-            'F': 60,  # Description
-            'G': 70,  # Arguments
-            'H': 20,  # Return Type
-            'I': 60,  # When to Use
-            'J': 60,  # When NOT to Use
-            'K': 65,  # Example
-            'L': 12,  # Real World Frequency
-            'M': 12,  # DSA Training Frequency
-            'N': 12,  # C++ Version
-            'O': 50,  # Notes
-        }
+    side = Side(style='thin', color=BORDER_COLOR)
+    border = Border(left=side, right=side, top=side, bottom=side)
+    body_align = Alignment(vertical="top", wrap_text=True)
+    # One PatternFill per distinct color; categories sharing a color share the object
+    solid_fills = {
+        color: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for color in dict.fromkeys(CATEGORY_COLORS.values())
+    }
     
-    for col_letter, width in column_widths.items():
-        if ord(col_letter) - ord('A') < ws.max_column:
-            ws.column_dimensions[col_letter].width = width
+    wb.add_named_style(NamedStyle(
+        name=HEADER_STYLE,
+        font=Font(bold=True, color=HEADER_FONT_COLOR, size=11),
+        fill=PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center", wrap_text=True),
+    ))
+    wb.add_named_style(NamedStyle(
+        name=BODY_STYLE, font=DEFAULT_FONT, fill=PatternFill(), border=border, alignment=body_align
+    ))
+    for category, color in CATEGORY_COLORS.items():
+        wb.add_named_style(NamedStyle(
+            name=CATEGORY_STYLES[category], font=DEFAULT_FONT, fill=solid_fills[color], border=border, alignment=body_align
+        ))
+
+
+def header_row(ws, headers):
+    """Header cells for a sheet, all sharing the registered header style"""
+    from openpyxl.cell import WriteOnlyCell
     
-    # Set row heights
-    ws.row_dimensions[1].height = 40
-    for row in range(2, ws.max_row + 1):
-        ws.row_dimensions[row].height = 60
+    header = []
+    for value in headers:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = HEADER_STYLE
+        header.append(cell)
+    return header
+
+
+def write_sheet(wb, title, headers, records):
+    """Stream catalog records into a write-only worksheet with formatting applied inline"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.worksheet.filters import AutoFilter
+    from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+    
+    ws = wb.create_sheet(title)
+    n_rows = len(records) + 1
+    n_cols = len(headers)
+    
+    # Column widths - one table per sheet layout, resolved once at import
+    for col_letter, width in COLUMN_WIDTHS[headers].items():
+        ws.column_dimensions[col_letter].width = width
+    
+    # Set row heights (must be in place before the rows are streamed)
+    ws.row_dimensions[1].height = HEADER_ROW_HEIGHT
+    for row in range(2, n_rows + 1):
+        ws.row_dimensions[row].height = BODY_ROW_HEIGHT
     
     # Freeze panes (freeze first row and first column)
     ws.freeze_panes = 'B2'
     
-    # Add autofilter
-    ws.auto_filter.ref = ws.dimensions
+    # Wrap the sheet in an Excel table with its own autofilter. Columns are
+    # declared up front because a write-only sheet cannot be read back for the
+    # header names (ws.add_table would only warn about that here).
+    table_ref = f"A1:{COL_LETTERS[n_cols - 1]}{n_rows}"
+    table = Table(
+        displayName=title.replace(" ", ""),
+        ref=table_ref,
+        autoFilter=AutoFilter(ref=table_ref),
+        tableColumns=[TableColumn(id=i, name=h) for i, h in enumerate(headers, start=1)],
+        # Category fills already band the rows, so the table style adds no stripes
+        tableStyleInfo=TableStyleInfo(name=TABLE_STYLE_NAME, showRowStripes=False),
+    )
+    ws.tables.add(table)
+    
+    ws.append(header_row(ws, headers))
+    
+    # Data rows - the per-cell loop runs rows x columns times, so the globals
+    # it touches are bound to locals first
+    make_cell = WriteOnlyCell
+    category_styles = CATEGORY_STYLES
+    append = ws.append
+    for record in records:
+        row_style = category_styles.get(record.category, BODY_STYLE)
+        row = [make_cell(ws, value=value) for value in record]
+        for cell in row:
+            cell.style = row_style
+        append(row)
 
 
 if __name__ == "__main__":
@@ -7329,9 +7815,12 @@ if __name__ == "__main__":
     print("=" * 70)
     print()
     
-    create_excel_catalog()
+    built = create_excel_catalog(force="--force" in sys.argv[1:])
+    # Optional plain-text copy of every sheet alongside the workbook
+    if "--csv" in sys.argv[1:]:
+        create_csv_catalog()
     
     print()
     print("=" * 70)
-    print("✓ Catalog generated successfully!")
+    print("✓ Catalog generated successfully!" if built else "✓ Catalog already up to date")
     print("=" * 70)
@@ -3,17 +3,27 @@ Comprehensive Data Structures Catalog Generator
 Generates a multi-sheet Excel workbook with detailed information about data structures
 across Java, C++, Python, and JavaScript.
 
-Run: python generate_datastructures_catalog.py
+Run: python generate_datastructures_catalog.py [--force]
+     (--force rebuilds the workbook even when it looks up to date)
 Requires: pip install pandas openpyxl
 """
 
+from array import array
+from collections import defaultdict
+import functools
+import hashlib
 import pandas as pd
 from pathlib import Path
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+from string import ascii_uppercase
+from zipfile import BadZipFile, ZipFile
 
 # ==============================================================================
 # MAIN STRUCTURES CATALOG
 # ==============================================================================
-structures = [
+structures = (
     # ==================== ARRAY-BASED LINEAR STRUCTURES ====================
     {
         "Category": "Linear - Array Based",
@@ -1141,12 +1151,12 @@ structures = [
         "When to use": "Space-efficient suffix structure; pattern matching; static text",
         "When NOT to use": "Dynamic text (suffix tree better for some queries); simple pattern matching"
     }
-]
+)
 
 # ==============================================================================
 # CONCEPTS EXPLANATIONS
 # ==============================================================================
-concepts = [
+concepts = (
     {
         "Concept": "Hash Table",
         "Explanation": "Data structure using hash function to map keys to buckets. Provides average O(1) lookup, insert, delete. Collision handling via chaining (linked lists) or open addressing (probing).",
@@ -1266,12 +1276,12 @@ concepts = [
         "When used": "Range sum/min/max queries; interval updates; cumulative statistics; dynamic data analysis",
         "When not used": "Point queries only; static data with no queries; simple array scan acceptable"
     }
-]
+)
 
 # ==============================================================================
 # OPERATIONS LEGEND
 # ==============================================================================
-operations_legend = [
+operations_legend = (
     {
         "Operation": "Access by index",
         "Meaning": "Time to retrieve element at specific numeric index position",
@@ -1337,12 +1347,12 @@ operations_legend = [
         "Meaning": "Extra memory beyond element storage (pointers, metadata, empty buckets, etc.)",
         "Example": "Array: minimal; LinkedList: 2 pointers per node; HashMap: buckets + load factor"
     }
-]
+)
 
 # ==============================================================================
 # COMMON LIBRARIES
 # ==============================================================================
-libraries = [
+libraries = (
     {
         "Language": "Java",
         "Category": "Collections Framework",
@@ -1383,12 +1393,12 @@ libraries = [
         "Category": "Third-party (npm)",
         "Libraries": "immutable.js: persistent data structures. lodash: utility functions. collections: MultiMap, SortedSet. datastructures-js: various implementations. mnemonist: trie, bloom filter, etc."
     }
-]
+)
 
 # ==============================================================================
 # COMPLEXITY NOTATION GUIDE
 # ==============================================================================
-complexity_guide = [
+complexity_guide = (
     {
         "Notation": "O(1)",
         "Name": "Constant",
@@ -1443,12 +1453,12 @@ complexity_guide = [
         "Description": "Time depends on parameter k (e.g., number of hash functions, string length)",
         "Examples": "Bloom filter operations (k hash functions), trie operations (k = key length)"
     }
-]
+)
 
 # ==============================================================================
 # USE CASE SCENARIOS
 # ==============================================================================
-use_cases = [
+use_cases = (
     {
         "Scenario": "Caching with size limit",
         "Requirements": "Fast access, automatic eviction, size bounded",
@@ -1666,54 +1676,372 @@ use_cases = [
         "Why": "O(log n) insert, O(1) median retrieval, balanced partition",
         "Avoid": "Sorting each time O(n log n), single heap (can't get median efficiently)"
     }
-]
+)
+
+# ==============================================================================
+# CATALOG RECORDS
+# ==============================================================================
+# Column order of the Data Structures sheet, as authored
+STRUCTURE_COLUMNS = tuple(structures[0])
+
+
+class StructureSpec(NamedTuple):
+    """One Data Structures row; fields follow STRUCTURE_COLUMNS"""
+    category: str
+    name: str
+    concept: str
+    java: str
+    cpp: str
+    python: str
+    javascript: str
+    access_by_index: str
+    access_front: str
+    access_back: str
+    insert_front: str
+    insert_middle: str
+    insert_back: str
+    delete_front: str
+    delete_middle: str
+    delete_back: str
+    search_unsorted: str
+    search_sorted: str
+    memory_locality: str
+    memory_overhead: str
+    ordered: str
+    duplicates: str
+    thread_safe: str
+    use_cases: str
+    industries: str
+    when_to_use: str
+    when_not_to_use: str
+
+
+STRUCTURES = tuple(StructureSpec._make([row[c] for c in STRUCTURE_COLUMNS]) for row in structures)
+
+
+# ==============================================================================
+# STRUCTURE QUERIES
+# ==============================================================================
+# Column-oriented views of STRUCTURES, built on first use and cached, so
+# writing the workbook (which never queries) does not build them.
+
+
+# Low-cardinality columns, stored as one-byte codes into a per-column vocabulary
+CATEGORICAL_COLUMNS = ("Category", "Memory locality", "Ordered", "Duplicates", "Thread-safe")
+
+# Yes/No-style columns; cells starting with "Yes" or "No" ("Yes (sorted)",
+# "No duplicate keys") count as answers, anything else ("Depends", "N/A") as neither
+FLAG_COLUMNS = ("Ordered", "Duplicates", "Thread-safe")
+
+# Language binding columns
+LANGUAGE_COLUMNS = ("Java", "C++", "Python", "JavaScript")
+
+# Language -> prefixes of the built-in and standard-library types its cells name.
+# A cell counts as built-in only when it starts with one of these; third-party
+# libraries (Guava, Boost, TBB, sortedcontainers, rbush, ...), deprecated
+# extensions (SGI std::rope) and "Custom ..." / "N/A" cells do not.
+STANDARD_LIBRARY_PREFIXES = {
+    "Java": (
+        "T[]", "boolean[]", "List<", "Queue<", "Stack<",
+        "ArrayList", "ArrayDeque", "LinkedList", "LinkedHashMap", "HashSet", "HashMap",
+        "TreeSet", "TreeMap", "PriorityQueue", "BitSet",
+        "ConcurrentHashMap", "ConcurrentSkipList", "ArrayBlockingQueue", "LinkedBlockingQueue",
+    ),
+    "C++": ("std::", "vector<"),
+    "Python": (
+        "list", "2D list", "dict", "set", "array.array", "collections.", "heapq",
+        "functools.lru_cache", "queue.Queue",
+    ),
+    "JavaScript": ("Array", "2D Array", "TypedArray", "Typed arrays", "Set", "Map"),
+}
+
+# Per-operation complexity columns; they share one vocabulary of notations
+COMPLEXITY_COLUMNS = (
+    "Access by index", "Access front", "Access back",
+    "Insert front", "Insert middle", "Insert back",
+    "Delete front", "Delete middle", "Delete back",
+    "Search unsorted", "Search sorted",
+)
+
+# Leading term of a notation -> growth class in n (lower grows slower).
+# Notations in other sizes (key length m/k, degree, V/E), "N/A" and "Complex"
+# are left unranked.
+COMPLEXITY_RANKS = {
+    "O(1)": 0,
+    "Amortized O(1)": 0,
+    "O(α(n))": 1,
+    "O(log n)": 2,
+    "O(n)": 3,
+}
+_RANKED_TERMS = sorted(COMPLEXITY_RANKS, key=len, reverse=True)
+UNRANKED = 255
+
+
+def complexity_rank(notation):
+    """Growth class of a complexity cell from its leading term, or UNRANKED"""
+    for term in _RANKED_TERMS:
+        if notation.startswith(term):
+            return COMPLEXITY_RANKS[term]
+    return UNRANKED
+
+
+def dictionary_encode(values):
+    """Split a low-cardinality column into its distinct values and one-byte codes"""
+    vocabulary = tuple(dict.fromkeys(values))
+    codes = {value: i for i, value in enumerate(vocabulary)}
+    return vocabulary, array('B', [codes[value] for value in values])
+
+
+# Short columns that filters and indexes scan, language bindings included. The
+# prose columns (Concept, Use cases, Industries, When to use, ...) stay on the
+# records and are only read when a structure itself is inspected.
+HOT_COLUMNS = (
+    "Category", "Name", *LANGUAGE_COLUMNS, *COMPLEXITY_COLUMNS,
+    "Memory locality", "Memory overhead", "Ordered", "Duplicates", "Thread-safe",
+)
+
+
+@functools.cache
+def structure_columns():
+    """Hot column name -> tuple of that column's values, in catalog order"""
+    positions = {column: STRUCTURE_COLUMNS.index(column) for column in HOT_COLUMNS}
+    return {column: tuple(spec[i] for spec in STRUCTURES) for column, i in positions.items()}
+
+
+@functools.cache
+def encoded_columns():
+    """Categorical columns as (vocabulary, codes) pairs"""
+    columns = structure_columns()
+    return {column: dictionary_encode(columns[column]) for column in CATEGORICAL_COLUMNS}
+
+
+@functools.cache
+def name_index():
+    """Read-only mapping of structure name -> record"""
+    return MappingProxyType({spec.name: spec for spec in STRUCTURES})
+
+
+@functools.cache
+def category_index():
+    """Read-only mapping of category -> records, in catalog order"""
+    # Categories recur in several places in the sheet, so rows are grouped
+    # here rather than relying on them being contiguous
+    groups = defaultdict(list)
+    for spec in STRUCTURES:
+        groups[spec.category].append(spec)
+    return MappingProxyType({category: tuple(specs) for category, specs in groups.items()})
+
+
+def get(name):
+    """Data Structures record for a name, e.g. get("Trie (Prefix Tree)")"""
+    return name_index()[name]
+
+
+def by_category(category):
+    """Data Structures records in a category, in catalog order"""
+    return category_index().get(category, ())
+
+
+@functools.cache
+def complexity_codes():
+    """Shared notation vocabulary, its growth ranks, and per-column one-byte codes"""
+    columns = structure_columns()
+    vocabulary = tuple(dict.fromkeys(v for column in COMPLEXITY_COLUMNS for v in columns[column]))
+    code = {notation: i for i, notation in enumerate(vocabulary)}
+    ranks = array('B', map(complexity_rank, vocabulary))
+    codes = {
+        column: array('B', [code[notation] for notation in columns[column]])
+        for column in COMPLEXITY_COLUMNS
+    }
+    return vocabulary, ranks, codes
+
+
+def no_worse_than(notation, column):
+    """Structures whose complexity grows no faster than notation
+
+    column is one of COMPLEXITY_COLUMNS. Cells that cannot be ranked (N/A,
+    O(m), O(V²), ...) are excluded.
+    """
+    limit = complexity_rank(notation)
+    if limit == UNRANKED:
+        raise ValueError(f"Unrecognised complexity: {notation!r}")
+    _, ranks, codes = complexity_codes()
+    return tuple(STRUCTURES[i] for i, c in enumerate(codes[column]) if ranks[c] <= limit)
+
+
+@functools.cache
+def flag_bitmaps():
+    """Flag column -> (yes, no) bitmaps, bit i set when row i answers that way"""
+    columns = structure_columns()
+    bitmaps = {}
+    for column in FLAG_COLUMNS:
+        yes = no = 0
+        for i, text in enumerate(columns[column]):
+            answer = text.split(" ", 1)[0]
+            if answer == "Yes":
+                yes |= 1 << i
+            elif answer == "No":
+                no |= 1 << i
+        bitmaps[column] = (yes, no)
+    return bitmaps
+
+
+def with_flags(ordered=None, duplicates=None, thread_safe=None):
+    """Structures matching every given flag (True = Yes, False = No), in catalog order"""
+    bitmaps = flag_bitmaps()
+    mask = (1 << len(STRUCTURES)) - 1
+    for column, wanted in zip(FLAG_COLUMNS, (ordered, duplicates, thread_safe)):
+        if wanted is not None:
+            yes, no = bitmaps[column]
+            mask &= yes if wanted else no
+    return rows_in(mask)
+
+
+@functools.cache
+def builtin_bitmaps():
+    """Language column -> bitmap, bit i set when row i names a standard-library type"""
+    columns = structure_columns()
+    return {
+        column: sum(
+            1 << i for i, text in enumerate(columns[column])
+            if text.startswith(STANDARD_LIBRARY_PREFIXES[column])
+        )
+        for column in LANGUAGE_COLUMNS
+    }
+
+
+def builtin_in(*languages):
+    """Structures with a standard-library type in every given language, in catalog order"""
+    bitmaps = builtin_bitmaps()
+    mask = (1 << len(STRUCTURES)) - 1
+    for language in languages:
+        mask &= bitmaps[language]
+    return rows_in(mask)
+
+
+def rows_in(mask):
+    """Records for the set bits of a row bitmap, lowest row first"""
+    found = []
+    while mask:
+        low = mask & -mask
+        found.append(STRUCTURES[low.bit_length() - 1])
+        mask ^= low
+    return tuple(found)
+
+
+@functools.cache
+def as_dataframe():
+    """The Data Structures table as a pandas DataFrame, built once and shared
+
+    Categorical columns use the category dtype. The frame is cached, so
+    callers should copy it before modifying it.
+    """
+    df = pd.DataFrame(STRUCTURES, columns=STRUCTURE_COLUMNS)
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype("category")
+    return df
+
+
+def where(column, value):
+    """Structures whose categorical column equals value, in catalog order"""
+    vocabulary, codes = encoded_columns()[column]
+    if value not in vocabulary:
+        return ()
+    code = vocabulary.index(value)
+    return tuple(STRUCTURES[i] for i, c in enumerate(codes) if c == code)
+
 
 # ==============================================================================
 # CREATE EXCEL WORKBOOK
 # ==============================================================================
-output_path = Path("/home/vasco-debian/Desktop/DEV/Versioned/Personal/exel_DS/datastructures_comprehensive_catalog.xlsx")
-
-# Create DataFrames
-df_structures = pd.DataFrame(structures)
-df_concepts = pd.DataFrame(concepts)
-df_operations = pd.DataFrame(operations_legend)
-df_libraries = pd.DataFrame(libraries)
-df_complexity = pd.DataFrame(complexity_guide)
-df_use_cases = pd.DataFrame(use_cases)
-
-# Write to Excel with multiple sheets
-with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-    df_structures.to_excel(writer, sheet_name='Data Structures', index=False)
-    df_concepts.to_excel(writer, sheet_name='Concepts', index=False)
-    df_operations.to_excel(writer, sheet_name='Operations Legend', index=False)
-    df_libraries.to_excel(writer, sheet_name='Libraries', index=False)
-    df_complexity.to_excel(writer, sheet_name='Complexity Guide', index=False)
-    df_use_cases.to_excel(writer, sheet_name='Use Case Scenarios', index=False)
+# Column letters A..IV, precomputed so the width loop indexes a tuple instead
+# of calling get_column_letter per column (and so openpyxl is only imported
+# once a workbook is actually written)
+COL_LETTERS = (*ascii_uppercase, *(a + b for a in ascii_uppercase for b in ascii_uppercase))[:256]
+
+# Custom document property recording which version of this script produced
+# the workbook, so an unchanged catalog is not rebuilt
+SOURCE_HASH_PROPERTY = "CatalogSourceHash"
+
+
+def source_hash():
+    """Digest of this script, which fully determines the workbook contents"""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def stored_source_hash(path):
+    """Source hash recorded in a previously generated workbook, or None"""
+    from openpyxl.packaging.custom import CustomPropertyList
+    from openpyxl.xml.constants import ARC_CUSTOM
+    from openpyxl.xml.functions import fromstring
+
+    try:
+        with ZipFile(path) as archive:
+            tree = fromstring(archive.read(ARC_CUSTOM))
+    except (FileNotFoundError, KeyError, BadZipFile):
+        return None
+    for prop in CustomPropertyList.from_tree(tree):
+        if prop.name == SOURCE_HASH_PROPERTY:
+            return prop.value
+    return None
+
+
+def create_excel_catalog(force=False):
+    """Creates the Excel workbook with one sheet per catalog table
+
+    force=True rebuilds it even when it was generated from this exact source.
+    """
+    from openpyxl.packaging.custom import StringProperty
+
+    output_path = Path("/home/vasco-debian/Desktop/DEV/Versioned/Personal/exel_DS/datastructures_comprehensive_catalog.xlsx")
+
+    # Source rows per sheet, in workbook order
+    sheet_rows = {
+        'Data Structures': structures,
+        'Concepts': concepts,
+        'Operations Legend': operations_legend,
+        'Libraries': libraries,
+        'Complexity Guide': complexity_guide,
+        'Use Case Scenarios': use_cases,
+    }
+
+    # Skip the rebuild when the workbook was generated from this exact source
+    digest = source_hash()
+    if not force and stored_source_hash(output_path) == digest:
+        print(f"✅ Catalog already up to date: {output_path}")
+        return
+
+    # Write to Excel with multiple sheets
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        writer.book.custom_doc_props.append(StringProperty(name=SOURCE_HASH_PROPERTY, value=digest))
+        for sheet_name, rows in sheet_rows.items():
+            # Column-oriented input: pandas takes each list as a column instead
+            # of walking every row dict to infer the schema
+            columns = {key: [row[key] for row in rows] for key in rows[0]}
+            pd.DataFrame(columns).to_excel(writer, sheet_name=sheet_name, index=False)
     
-    # Auto-adjust column widths for readability
-    for sheet_name in writer.sheets:
-        worksheet = writer.sheets[sheet_name]
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 for readability
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-
-print(f"✅ Successfully created comprehensive data structures catalog!")
-print(f"📁 Location: {output_path}")
-print(f"\n📊 Workbook contains {len(writer.sheets)} sheets:")
-print("   1. Data Structures - Main catalog with all structures")
-print("   2. Concepts - Detailed explanations of core concepts")
-print("   3. Operations Legend - What each complexity column means")
-print("   4. Libraries - Common libraries per language")
-print("   5. Complexity Guide - Big-O notation explained")
-print("   6. Use Case Scenarios - When to use which structure")
-print(f"\n📈 Total structures documented: {len(structures)}")
-print(f"🔍 Total concepts explained: {len(concepts)}")
-print(f"💡 Total use cases: {len(use_cases)}")
+            # Auto-adjust column widths for readability.
+            # Measured on the same column lists, so no openpyxl Cell objects
+            # are created just to be measured; map() keeps the scan in C.
+            worksheet = writer.sheets[sheet_name]
+            for j, (key, values) in enumerate(columns.items()):
+                max_length = max(len(key), *map(len, map(str, values)))
+                adjusted_width = min(max_length + 2, 50)  # Cap at 50 for readability
+                worksheet.column_dimensions[COL_LETTERS[j]].width = adjusted_width
+
+    print(f"✅ Successfully created comprehensive data structures catalog!")
+    print(f"📁 Location: {output_path}")
+    print(f"\n📊 Workbook contains {len(writer.sheets)} sheets:")
+    print("   1. Data Structures - Main catalog with all structures")
+    print("   2. Concepts - Detailed explanations of core concepts")
+    print("   3. Operations Legend - What each complexity column means")
+    print("   4. Libraries - Common libraries per language")
+    print("   5. Complexity Guide - Big-O notation explained")
+    print("   6. Use Case Scenarios - When to use which structure")
+    print(f"\n📈 Total structures documented: {len(structures)}")
+    print(f"🔍 Total concepts explained: {len(concepts)}")
+    print(f"💡 Total use cases: {len(use_cases)}")
+
+
+if __name__ == "__main__":
+    create_excel_catalog(force="--force" in sys.argv[1:])